@@ -3,33 +3,81 @@ Functions to help runtime interpretation of typehints.
 """
 
 
+import builtins
 import sys
-from types import GenericAlias
+from functools import lru_cache
+from types import CodeType, GenericAlias
 from typing import Any, ForwardRef, get_args
 
+if sys.version_info >= (3, 11):
+    from typing import Self
+else:
+    from typing_extensions import Self
 
-def typehint_eval(
-    code: str, __globals: dict[str, Any], __locals: dict[str, Any]
-) -> Any:
+
+class _ForwardDict(dict[str, Any]):
+    """
+    Local namespace for evaluating typehints.
+    Names that can't be found locally, in the module or in builtins are
+    returned as strings so they can be treated as forward references.
+    """
+
+    def __init__(self, module_vars: dict[str, Any], **kwargs: Any):
+        super().__init__(**kwargs)
+        self.module_vars = module_vars
+
+    def __missing__(self, key: str) -> Any:
+        if key in self.module_vars:
+            return self.module_vars[key]
+        return getattr(builtins, key, key)
+
+
+# String annotations of builtin types that can skip evaluation.
+_BUILTIN_TYPES = (str, int, float, bool, bytes, list, dict)
+_BUILTIN_ANNOTATION_MAP: dict[str, Any] = {
+    **{t.__name__: t for t in _BUILTIN_TYPES},
+    **{f"{t.__name__} | None": t | None for t in _BUILTIN_TYPES},
+}
+
+
+@lru_cache(maxsize=1024)
+def _compile_typehint(code: str) -> CodeType:
+    """
+    Compile a string typehint. The same strings (e.g. 'str | None')
+    recur across models, so this only needs doing once per string.
+    """
+    return compile(code, "<typehint>", "eval")
+
+
+def typehint_eval(code: str, namespace: _ForwardDict) -> Any:
     """
     Evaluate a string of code for a typehint.
     If something hasn't appeared yet, store as a string.
     """
-    try:
-        return eval(code, __globals, __locals)  # pylint: disable=eval-used
-    except NameError as e:
-        new_code = code.replace(e.name, f'"{e.name}"')
-        return typehint_eval(new_code, __globals, __locals)
+    if code in _BUILTIN_ANNOTATION_MAP:
+        # common builtin hints don't need evaluating
+        return _BUILTIN_ANNOTATION_MAP[code]
+    return eval(  # pylint: disable=eval-used
+        _compile_typehint(code), namespace.module_vars, namespace
+    )
 
 
 def get_type_hints_from_class_dict(attrs: dict[str, Any]) -> dict[str, Any]:
     """
     Evaluate annotations in the context of the metatype.
     """
-    allowed = vars(sys.modules[attrs["__module__"]])
+    annotations = attrs.get("__annotations__")
+    if not annotations:
+        return {}
+    if not any(type(v) is str for v in annotations.values()):
+        # already evaluated (no PEP 563), so can be used as is.
+        # This is the class's own dict and should not be modified.
+        return annotations
+
+    namespace = _ForwardDict(vars(sys.modules[attrs["__module__"]]), Self=Self)
     return {
-        k: typehint_eval(v, allowed, allowed) if isinstance(v, str) else v
-        for k, v in attrs.get("__annotations__", {}).items()
+        k: typehint_eval(v, namespace) if isinstance(v, str) else v
+        for k, v in annotations.items()
     }
 
 
@@ -38,7 +86,8 @@ def get_specialisation_name_or_type(alias: GenericAlias) -> type | str:
     Given something that's a generic alias, get its specialisation
     and extract the name from a forward ref if that's being used.
     """
-    first_arg = get_args(alias)[0]
-    if isinstance(first_arg, ForwardRef):
-        first_arg = first_arg.__forward_arg__
+    args = getattr(alias, "__args__", None)
+    first_arg = args[0] if args else get_args(alias)[0]
+    if type(first_arg) is ForwardRef:
+        return first_arg.__forward_arg__
     return first_arg
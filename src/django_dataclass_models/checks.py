@@ -15,22 +15,26 @@ def reverse_foreign_key_warning(
     Generate warning for when foreign key relationships are not explicit for freeform models.
     """
     errors: list[CheckMessage] = []
+    typed_models: dict[str, list[type[TypedModel]]] = {}
     for model_dict in apps.all_models.values():
         for model in model_dict.values():
             if issubclass(model, TypedModel):
-                for ir in ForeignRegistry.check_model_valid(model.__name__):
-                    errors.append(
-                        Warning(
-                            "Missing explicit reverse relationship for this foreign key. Django doesn't require this, but it helps with typing.",
-                            hint=f"Expecting equivalent in {ir.modelB} model of '{ir.fieldB}: {ir.reverse_mode()}[{ir.modelA}] = related('{ir.fieldA}')'",
-                            obj=".".join(
-                                [
-                                    str(model._meta.app_label),  # type: ignore
-                                    ir.modelA,
-                                    ir.fieldA,
-                                ]
-                            ),
-                            id="freeform.W001",
-                        )
-                    )
+                typed_models.setdefault(model.__name__, []).append(model)
+
+    for ir in ForeignRegistry.all_relationships_resolved():
+        for model in typed_models.get(ir.modelB, ()):
+            errors.append(
+                Warning(
+                    "Missing explicit reverse relationship for this foreign key. Django doesn't require this, but it helps with typing.",
+                    hint=f"Expecting equivalent in {ir.modelB} model of '{ir.fieldB}: {ir.reverse_mode()}[{ir.modelA}] = related('{ir.fieldA}')'",
+                    obj=".".join(
+                        [
+                            str(model._meta.app_label),  # type: ignore
+                            ir.modelA,
+                            ir.fieldA,
+                        ]
+                    ),
+                    id="freeform.W001",
+                )
+            )
     return errors
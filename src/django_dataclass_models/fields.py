@@ -9,7 +9,7 @@ if sys.version_info >= (3, 10):
 else:
     from typing_extensions import ParamSpec
 
-from typing import TYPE_CHECKING, Any, Callable, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
 from django.db.models import Field as DjangoField
 
@@ -19,11 +19,11 @@ class TypeSafeMeta(type):
     Metaclass to use Field directly rather than requiring an instance.
     """
 
-    def __or__(cls, other: Any):
+    def __or__(cls, other: Any) -> Any:
         """
         Cast 'other' in x | other to Any.
         """
-        return cast(Any, other)
+        return other
 
 
 class Field(metaclass=TypeSafeMeta):
@@ -55,4 +55,4 @@ def field(field_type: Callable[_P, _Field], *args: _P.args, **kwargs: _P.kwargs)
     Create a field with the given type.
     """
 
-    return cast(Any, field_type(*args, **kwargs))
+    return field_type(*args, **kwargs)
@@ -6,6 +6,8 @@ foreign key relationships.
 
 from __future__ import annotations
 
+import sys
+from functools import lru_cache
 from typing import Any, Generic, Literal, Type, TypeVar, get_origin
 
 from django.db import models
@@ -96,6 +98,48 @@ valid_mode = (
 )
 
 
+# Modes are interned singletons so they can be compared by identity.
+ONE_TO_ONE: Literal["OneToOne"] = sys.intern("OneToOne")  # type: ignore
+ONE_TO_MANY: Literal["OneToMany"] = sys.intern("OneToMany")  # type: ignore
+MANY_TO_ONE: Literal["ManyToOne"] = sys.intern("ManyToOne")  # type: ignore
+MANY_TO_MANY: Literal["ManyToMany"] = sys.intern("ManyToMany")  # type: ignore
+
+# Canonical mode for each valid mode string.
+_MODES: dict[str, valid_mode] = {
+    mode: mode for mode in (ONE_TO_ONE, ONE_TO_MANY, MANY_TO_ONE, MANY_TO_MANY)
+}
+
+# The mode of a relationship as seen from the other side.
+_FLIP: dict[str, valid_mode] = {
+    ONE_TO_ONE: ONE_TO_ONE,
+    ONE_TO_MANY: MANY_TO_ONE,
+    MANY_TO_ONE: ONE_TO_MANY,
+    MANY_TO_MANY: MANY_TO_MANY,
+}
+
+# Django field flags that identify a mode, in order of precedence.
+_ATTR_TO_MODE: tuple[tuple[str, valid_mode], ...] = (
+    ("many_to_many", MANY_TO_MANY),
+    ("one_to_one", ONE_TO_ONE),
+    ("one_to_many", ONE_TO_MANY),
+    ("many_to_one", MANY_TO_ONE),
+)
+
+# Modes for field classes already seen by field_type_to_mode.
+_MODE_BY_CLASS: dict[type, valid_mode] = {}
+
+
+@lru_cache(maxsize=None)
+def _default_related_name(model_name: str, mode: valid_mode) -> str:
+    """
+    The name django gives the reverse end of a relationship by default.
+    """
+    name = sys.intern(model_name.lower())
+    if mode is ONE_TO_ONE:
+        return name
+    return sys.intern(name + "_set")
+
+
 class RelatedStandIn:
     """
     Stand in for the related field that allows us to access the model
@@ -113,6 +157,7 @@ class OneToManyFieldStandIn:
     some values in the meantime so reverse relations can be registered.
     """
 
+    is_relation = True
     one_to_one = False
     one_to_many = True
     many_to_many = False
@@ -141,26 +186,35 @@ class ForeignRegistry:
 
     _key_type = tuple[valid_mode, str, str, str, str]
     _registry: dict[_key_type, ForeignRegistry] = {}
+    # Secondary indexes: relationships by the model they point at, and
+    # relationships still without a reverse (a dict to keep them in order).
+    _by_modelB: dict[str, list[ForeignRegistry]] = {}
+    _unresolved: dict[ForeignRegistry, None] = {}
 
-    ONE_TO_ONE = "OneToOne"
-    ONE_TO_MANY = "OneToMany"
-    MANY_TO_ONE = "ManyToOne"
-    MANY_TO_MANY = "ManyToMany"
+    ONE_TO_ONE = ONE_TO_ONE
+    ONE_TO_MANY = ONE_TO_MANY
+    MANY_TO_ONE = MANY_TO_ONE
+    MANY_TO_MANY = MANY_TO_MANY
 
     @classmethod
     def field_type_to_mode(cls, field_type: type) -> valid_mode:
         """
         Convert a field type to a mode
         """
+        if mode := _MODE_BY_CLASS.get(field_type):
+            return mode
         if issubclass(field_type, models.ForeignKey):
-            return cls.MANY_TO_ONE
+            mode = cls.MANY_TO_ONE
         elif issubclass(field_type, models.ManyToManyField):
-            return cls.MANY_TO_MANY
+            mode = cls.MANY_TO_MANY
         elif issubclass(field_type, models.OneToOneField):
-            return cls.ONE_TO_ONE
+            mode = cls.ONE_TO_ONE
         elif issubclass(field_type, OneToManyFieldStandIn):
-            return cls.ONE_TO_MANY
-        raise ValueError(f"Unknown field type {field_type}")
+            mode = cls.ONE_TO_MANY
+        else:
+            raise ValueError(f"Unknown field type {field_type}")
+        _MODE_BY_CLASS[field_type] = mode
+        return mode
 
     @classmethod
     def all_relationships_resolved(cls):
@@ -168,11 +222,7 @@ class ForeignRegistry:
         Check if all relationships are resolved and return
         A list of all unresolved relationships.
         """
-        return [
-            relationship
-            for relationship in cls._registry.values()
-            if relationship.reverse_created is False
-        ]
+        return list(cls._unresolved)
 
     @classmethod
     def check_model_valid(cls, model: str):
@@ -183,8 +233,8 @@ class ForeignRegistry:
 
         return [
             relationship
-            for relationship in cls._registry.values()
-            if relationship.modelB == model and relationship.reverse_created is False
+            for relationship in cls._by_modelB.get(model, ())
+            if relationship.reverse_created is False
         ]
 
     @classmethod
@@ -193,34 +243,19 @@ class ForeignRegistry:
         Reverse the direction of the relationship to help find
         the reverse relationship.
         """
-        match mode:
-            case cls.ONE_TO_ONE:
-                return cls.ONE_TO_ONE
-            case cls.ONE_TO_MANY:
-                return cls.MANY_TO_ONE
-            case cls.MANY_TO_ONE:
-                return cls.ONE_TO_MANY
-            case cls.MANY_TO_MANY:
-                return cls.MANY_TO_MANY
-            case _:
-                raise ValueError(f"reverse not found for {mode}")
+        try:
+            return _FLIP[mode]
+        except KeyError:
+            raise ValueError(f"reverse not found for {mode}") from None
 
     def str_to_mode(self, mode: str) -> valid_mode:
         """
         Convert a string to a mode - makes type checker happy
         """
-        match mode:
-            case self.ONE_TO_ONE:
-                return self.ONE_TO_ONE
-            case self.ONE_TO_MANY:
-                return self.ONE_TO_MANY
-            case self.MANY_TO_ONE:
-                return self.MANY_TO_ONE
-            case self.MANY_TO_MANY:
-                return self.MANY_TO_MANY
-            case _:
-                ...
-        raise ValueError(f"Unknown mode {mode}")
+        try:
+            return _MODES[mode]
+        except KeyError:
+            raise ValueError(f"Unknown mode {mode}") from None
 
     @classmethod
     def register_field_object(
@@ -229,14 +264,10 @@ class ForeignRegistry:
         """
         Register a field object in the registry.
         """
-        if field.__class__.many_to_many is True:
-            mode = cls.MANY_TO_MANY
-        elif field.__class__.one_to_one is True:
-            mode = cls.ONE_TO_ONE
-        elif field.__class__.one_to_many is True:
-            mode = cls.ONE_TO_MANY
-        elif field.__class__.many_to_one is True:
-            mode = cls.MANY_TO_ONE
+        field_class = field.__class__
+        for attr, mode in _ATTR_TO_MODE:
+            if getattr(field_class, attr) is True:
+                break
         else:
             raise ValueError(f"Unknown field mode {field}")
         modelA = model_name
@@ -263,15 +294,13 @@ class ForeignRegistry:
 
         if hasattr(mode, "__origin__"):
             mode = self.str_to_mode(get_origin(mode).__name__)  # type: ignore
+
+        if isinstance(mode, str):
+            # swap for the interned mode, so later checks can use identity
+            mode = self.str_to_mode(mode)
+
         if fieldB is None:
-            if mode == self.ONE_TO_ONE:
-                fieldB = modelA.lower()
-            elif mode == self.ONE_TO_MANY:
-                fieldB = modelA.lower() + "_set"
-            elif mode == self.MANY_TO_ONE:
-                fieldB = modelA.lower() + "_set"
-            elif mode == self.MANY_TO_MANY:
-                fieldB = modelA.lower() + "_set"
+            fieldB = _default_related_name(modelA, mode)  # type: ignore
 
         self.mode: valid_mode = mode  # type: ignore
         self.modelA = modelA
@@ -279,7 +308,27 @@ class ForeignRegistry:
         self.fieldA = fieldA
         self.fieldB = fieldB
         self.reverse_created: bool = False
-        self._registry[self.get_key()] = self
+        self._key: ForeignRegistry._key_type = (
+            self.mode,
+            self.modelA,
+            self.modelB,
+            self.fieldA,
+            fieldB,
+        )
+        self._rkey: ForeignRegistry._key_type = (
+            self.__class__.flip_mode(self.mode),
+            self.modelB,
+            self.modelA,
+            fieldB,
+            self.fieldA,
+        )
+        if (previous := self._registry.get(self._key)) is not None:
+            # replacing an earlier registration, so drop it from the indexes
+            self._by_modelB[previous.modelB].remove(previous)
+            self._unresolved.pop(previous, None)
+        self._registry[self._key] = self
+        self._by_modelB.setdefault(self.modelB, []).append(self)
+        self._unresolved[self] = None
         self.check_for_reverse()
 
     def reverse_mode(self):
@@ -294,32 +343,25 @@ class ForeignRegistry:
 
         """
         if (rkey := self.get_reverse_key()) in self._registry:
-            self.reverse_created = True
             reverse = self._registry[rkey]
             if reverse.reverse_created is True:
                 # A reverse of this has already been registered, uh oh
                 raise ValueError(
                     f"Multiple possible reverse relationships registered for relationship {reverse.get_key()}."
                 )
+            self.reverse_created = True
             reverse.reverse_created = True
+            self._unresolved.pop(self, None)
+            self._unresolved.pop(reverse, None)
 
     def get_key(self) -> _key_type:
         """
         return a tuple that compounds all input values in a way that can be checked
         """
-        self.mode: valid_mode = self.mode
-        if self.fieldB is None:
-            raise ValueError(f"fieldB is None for {self.get_key()}")
-        return (self.mode, self.modelA, self.modelB, self.fieldA, self.fieldB)
+        return self._key
 
-    def get_reverse_key(self):
+    def get_reverse_key(self) -> _key_type:
         """
         Tuple that mirrors the key the reverse relationship should have
         """
-        return (
-            self.__class__.flip_mode(self.mode),
-            self.modelB,
-            self.modelA,
-            self.fieldB,
-            self.fieldA,
-        )
+        return self._rkey
@@ -3,18 +3,21 @@ from __future__ import annotations
 import sys
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
-from types import GenericAlias, UnionType
+from functools import lru_cache
+from string import ascii_lowercase
+from types import GenericAlias, MappingProxyType, UnionType
 from typing import (
     TYPE_CHECKING,
     Annotated,
     Any,
+    Callable,
     Generic,
     Literal,
+    Mapping,
     Type,
     TypeVar,
     Union,
     cast,
-    get_args,
     get_origin,
 )
 
@@ -64,11 +67,43 @@ else:
     BaseField = models.Field
 
 
+_SNAKE_CASE_CHARS = frozenset(ascii_lowercase + "_")
+
+
 def is_snake_case(name: str) -> bool:
     """
     Check if a string is in snake case. Only lower case letters and underscores are allowed..
     """
-    return all(c.islower() or c == "_" for c in name)
+    return _SNAKE_CASE_CHARS.issuperset(name)
+
+
+_NoneType = type(None)
+
+
+def _unwrap_optional(field_type: Any) -> tuple[Any, bool]:
+    """
+    Given a union with None (e.g. 'str | None'), return the other type
+    and True to show the field is nullable.
+    Anything else is returned as is, and False.
+    """
+    field_args = getattr(field_type, "__args__", None)
+    if not field_args or not (
+        isinstance(field_type, UnionType)
+        or getattr(field_type, "__origin__", None) is Union
+    ):
+        return field_type, False
+    if len(field_args) == 2:
+        a, b = field_args
+        if b is _NoneType:
+            return a, True
+        if a is _NoneType:
+            return b, True
+    non_null = [x for x in field_args if x is not _NoneType]
+    if len(non_null) != 1:
+        raise ValueError(
+            f"Cannot determine field type for {field_type}, nothing other than None in Union"
+        )
+    return non_null[0], len(non_null) != len(field_args)
 
 
 def related(related_name: str) -> Any:
@@ -95,7 +130,8 @@ class FieldLookup(Generic[_Field]):
     ):
         self.field = field
         self.default_key = default_key
-        self.default_kwargs = kwargs
+        # read-only, as lookups are shared between every field they create
+        self.default_kwargs: Mapping[str, Any] = MappingProxyType(kwargs)
 
     def item(
         self, default: None | str = None, null: bool = False, blank: bool = False
@@ -104,6 +140,9 @@ class FieldLookup(Generic[_Field]):
         Return the field with the configured options.
         """
 
+        if not (null or blank or default):
+            return self.field(**self.default_kwargs)  # type: ignore
+
         kwargs = {**self.default_kwargs}
         if null:
             kwargs["null"] = null
@@ -145,6 +184,55 @@ types_to_fields: dict[type | str, FieldLookup[Any]] = {
 }
 
 
+# Lookups for relationships are cached by related model, as the same
+# targets (especially "self") recur across many models.
+@lru_cache(maxsize=None)
+def _foreign_key_lookup(to: type | str) -> FieldLookup[Any]:
+    # Standard ManyToOne relationship
+    return FieldLookup(
+        models.ForeignKey,
+        default_key="related_name",
+        on_delete=models.CASCADE,
+        to=to,
+    )
+
+
+@lru_cache(maxsize=None)
+def _one_to_one_lookup(to: type | str) -> FieldLookup[Any]:
+    # Standard OneToOne relationship
+    return FieldLookup(
+        models.OneToOneField,
+        default_key="related_name",
+        to=to,
+        on_delete=models.CASCADE,
+    )
+
+
+@lru_cache(maxsize=None)
+def _many_to_many_lookup(to: type | str) -> FieldLookup[Any]:
+    return FieldLookup(models.ManyToManyField, to=to, default_key="related_name")
+
+
+@lru_cache(maxsize=None)
+def _one_to_many_lookup(to: type | str) -> FieldLookup[Any]:
+    # this is a psuedo field that will get removed later - but is
+    # used to validate both sides of a related relationship.
+    return FieldLookup(OneToManyFieldStandIn, to=to, default_key="related_name")
+
+
+# Relationships given as an instance, e.g. ManyToOne[Model] -> ManyToOne(Model)
+_INSTANCE_DISPATCH: dict[type, Callable[[type | str], FieldLookup[Any]]] = {
+    ManyToOne: _foreign_key_lookup,
+    OneToOne: _one_to_one_lookup,
+}
+
+# Relationships given as a generic alias, e.g. ManyToMany[Model]
+_ORIGIN_DISPATCH: dict[Any, Callable[[type | str], FieldLookup[Any]]] = {
+    ManyToMany: _many_to_many_lookup,
+    OneToMany: _one_to_many_lookup,
+}
+
+
 class FieldTypeRegistry:
     """
     Lookup table for types to django field objects
@@ -177,52 +265,24 @@ class FieldTypeRegistry:
         ) or isinstance(field_type, str):
             field_type = ManyToOne(field_type)
 
-        is_generic_alias = hasattr(field_type, "__origin__")
-        is_annotated_type = hasattr(field_type, "__metadata__")
-
         # get FieldLookup for various foreign key relationships
-        if isinstance(field_type, ManyToOne):
-            # Standard ManyToOne relationship
-            return FieldLookup(
-                models.ForeignKey,
-                default_key="related_name",
-                on_delete=models.CASCADE,
-                to=fix_self(field_type.item),
-            )
-        elif isinstance(field_type, OneToOne):
-            # Standard OneToOne relationship
-            return FieldLookup(
-                models.OneToOneField,
-                default_key="related_name",
-                to=fix_self(field_type.item),
-                on_delete=models.CASCADE,
-            )
-        elif is_generic_alias and get_origin(field_type) == ManyToMany:
+        if instance_handler := _INSTANCE_DISPATCH.get(type(field_type)):
+            # Given ManyToOne(Model) or OneToOne(Model), use the held model.
+            field_type = cast(RelatedBase, field_type)
+            return instance_handler(fix_self(field_type.item))
+        origin = get_origin(field_type)
+        if origin_handler := _ORIGIN_DISPATCH.get(origin):
             # Given ManyToMany[Model], use "Model" (or "self") in a Foreign Key relationship.
             related_model = fix_self(get_specialisation_name_or_type(field_type))  # type: ignore
-            return FieldLookup(
-                models.ManyToManyField, to=related_model, default_key="related_name"
-            )
-        elif is_generic_alias and get_origin(field_type) == OneToMany:
-            # this is a psuedo field that will get removed later - but is
-            # used to validate both sides of a related relationship.
-            related_model = fix_self(get_specialisation_name_or_type(field_type))  # type: ignore
-            return FieldLookup(
-                OneToManyFieldStandIn, to=related_model, default_key="related_name"
-            )
+            return origin_handler(related_model)
         elif field_type == GenericManager[Any]:
             # check we're just using a subclass of GenericManager
             raise NotImplementedError("GenericManager is not implemented")
-        if is_generic_alias and not is_annotated_type:
-            # this is dealing with stuff like `'list[int]'
-            origin = get_origin(field_type)
-            if not origin:
-                raise ValueError(f"Could not determine origin of {field_type}")
-            field_type = origin
-        if is_annotated_type:
+
+        metadata = getattr(field_type, "__metadata__", None)
+        if metadata is not None:
             # This deals with fields where the FieldLookup has been hidden
             # within an annotation.
-            metadata = getattr(field_type, "__metadata__")
             if len(metadata) == 1 and isinstance(metadata[0], FieldLookup):
                 return metadata[0]
             # Or when the annotation is a Field class and a dictionary of default options.
@@ -237,10 +297,103 @@ class FieldTypeRegistry:
                 raise ValueError(
                     f"Metadata for {field_type} is not valid, does not fit either 'FieldLookup' instance, or 'Field, dict' patterns."
                 )
+        if origin is not None:
+            # this is dealing with stuff like `'list[int]'
+            field_type = origin
+        elif hasattr(field_type, "__origin__"):
+            raise ValueError(f"Could not determine origin of {field_type}")
         field_type = cast(type, field_type)
         return cls.lookup_registry.get(field_type, None)
 
 
+class _FieldPlan:
+    """
+    What to do with an annotated attribute of a class being created.
+    Without a lookup, the attribute is already a relation field and just needs registering.
+    """
+
+    def __init__(
+        self,
+        variable: str,
+        lookup: FieldLookup[Any] | None = None,
+        default: str | None = None,
+        null: bool = False,
+    ):
+        self.variable = variable
+        self.lookup = lookup
+        self.default = default
+        self.null = null
+
+    def apply(self, model_name: str, dct: dict[str, Any]):
+        """
+        Register and add (or remove) the django field in the class dict.
+        """
+        if self.lookup is None:
+            # Register a manually created relation and move on
+            ForeignRegistry.register_field_object(
+                model_name=model_name,
+                field_name=self.variable,
+                field=dct[self.variable],
+            )
+            return
+
+        field_object = self.lookup.item(default=self.default, null=self.null)
+
+        # if field_object is a foreign key relationship, we need to register it
+        # (the stand-in copies the flags django sets on relation fields)
+        if getattr(field_object, "is_relation", False):
+            registered = ForeignRegistry.register_field_object(
+                model_name=model_name, field_name=self.variable, field=field_object  # type: ignore
+            )
+            # In this case, if the reverse is acknowledged, we dump the value because we
+            # don't want to register both ends.
+            if field_object.many_to_many or field_object.one_to_one:  # type: ignore
+                if registered.reverse_created:
+                    field_object = _Nullify
+
+            # can't actually have a value here or it'll get confused, and need
+            # to clear out any str default value.
+
+            if field_object is OneToManyFieldStandIn:
+                field_object = _Nullify
+        if field_object:
+            dct[self.variable] = field_object
+            if field_object == _Nullify:
+                del dct[self.variable]
+
+
+def _plan_fields(annotations: dict[str, Any], dct: dict[str, Any]) -> list[_FieldPlan]:
+    """
+    Work out the fields needed for the typehints of a class, before any are created.
+    """
+    plans: list[_FieldPlan] = []
+    for variable, field_type in annotations.items():
+        # non snake case are assumed to be constants that shouldn't be transformed
+        if not is_snake_case(variable):
+            continue
+
+        # get any object already assigned to this value
+        default = None
+        default_or_value = dct.get(variable, None)
+        if isinstance(default_or_value, str):
+            default = default_or_value
+        elif isinstance(default_or_value, models.ForeignObject):
+            plans.append(_FieldPlan(variable))
+            continue
+        elif default_or_value:
+            continue
+
+        field_type, null = _unwrap_optional(field_type)
+
+        field_instance = FieldTypeRegistry.get_django_lookup(field_type)
+        if field_instance is None:
+            raise ValueError(
+                f"Field '{variable}' has typehint '{field_type}', but there is no default django field for that type."
+            )
+        plans.append(_FieldPlan(variable, field_instance, default=default, null=null))
+    return plans
+
+
 @dataclass_transform(kw_only_default=True, field_specifiers=(field_helper,))
 class TypedModelBase(models.base.ModelBase):
     """
@@ -252,83 +405,14 @@ class TypedModelBase(models.base.ModelBase):
         Convert typed style fields declarations to django style fields.
         Also convert any keyword arguments to a django meta class.
         """
-        annotations = get_type_hints_from_class_dict(dct)
-
-        for variable, field_type in annotations.items():
-            # non snake case are assumed to be constants that shouldn't be transformed
-            if not is_snake_case(variable):
-                continue
-
-            # get any object already assigned to this value
-            default = None
-            default_or_value = dct.get(variable, None)
-            if isinstance(default_or_value, str):
-                default = default_or_value
-            elif isinstance(default_or_value, models.ForeignObject):
-                # Register a manually created relation and move on
-                if TYPE_CHECKING:
-                    # when type checking Foreign Office has generic, but not at run time
-                    default_or_value = cast(models.ForeignObject[Any, Any], default_or_value)  # type: ignore
-                ForeignRegistry.register_field_object(
-                    model_name=name, field_name=variable, field=default_or_value
-                )
-                continue
-            elif default_or_value:
-                continue
-
-            null = False
-            if (
-                isinstance(field_type, UnionType)
-                or getattr(field_type, "__origin__", None) == Union
-            ):
-                field_args = get_args(field_type)
-                null = any([x == type(None) for x in field_args])
-                non_null = [x for x in field_args if x is not type(None)]
-                if len(non_null) == 1:
-                    field_type = non_null[0]
-                else:
-                    raise ValueError(
-                        f"Cannot determine field type for {field_type}, nothing other than None in Union"
-                    )
-
-            field_instance = FieldTypeRegistry.get_django_lookup(field_type)
-            if field_instance is None:
-                raise ValueError(
-                    f"Field '{variable}' has typehint '{field_type}', but there is no default django field for that type."
-                )
-            field_object = field_instance.item(default=default, null=null)
-
-            # if field_object is a foreign key relationship, we need to register it
-            if isinstance(
-                field_object,
-                OneToManyFieldStandIn
-                | models.ForeignKey
-                | models.ManyToManyField
-                | models.OneToOneField,
-            ):
-                registered = ForeignRegistry.register_field_object(
-                    model_name=name, field_name=variable, field=field_object  # type: ignore
-                )
-                # In this case, if the reverse is acknowledged, we dump the value because we
-                # don't want to register both ends.
-                if isinstance(
-                    field_object, (models.ManyToManyField, models.OneToOneField)
-                ):
-                    if registered.reverse_created:
-                        field_object = _Nullify
-
-                # can't actually have a value here or it'll get confused, and need
-                # to clear out any str default value.
-
-                if field_object is OneToManyFieldStandIn:
-                    field_object = _Nullify
-            if field_object:
-                dct[variable] = field_object
-                if field_object == _Nullify:
-                    del dct[variable]
+        # classes without typehints (e.g. abstract stubs) have no fields to convert
+        if dct.get("__annotations__"):
+            annotations = get_type_hints_from_class_dict(dct)
+            for plan in _plan_fields(annotations, dct):
+                plan.apply(name, dct)
 
         if kwargs:
-            dct["Meta"] = type("Meta", (type,), kwargs)
+            dct["Meta"] = type("Meta", (), kwargs)
 
         return super().__new__(cls, name, bases, dct)
 
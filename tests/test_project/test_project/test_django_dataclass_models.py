@@ -2,10 +2,13 @@ import os
 from typing import Any
 
 import django
+import pytest
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "test_project.settings")
 django.setup()
 
+from django_dataclass_models.annotation_funcs import get_type_hints_from_class_dict
+from django_dataclass_models.foreign_key_typing import ForeignRegistry
 from testapp.models import (
     ExampleTypedModel,
     OriginalAbstractModel,
@@ -38,3 +41,40 @@ def test_abstract():
     assert check_if_django_model_is_abstract(TypedAbstractModel)  # type: ignore
     assert check_if_django_model_is_abstract(OriginalAbstractModel)  # type: ignore
     assert check_if_django_model_is_abstract(ExampleTypedModel) is False
+
+
+def test_meta_from_kwargs():
+    # keyword arguments become a plain Meta options class, not a metaclass
+    assert TypedAbstractModel._meta.abstract is True  # type: ignore
+    assert not issubclass(TypedAbstractModel.Meta, type)  # type: ignore
+
+
+def test_forward_references_kept_as_strings():
+    # names that don't exist yet are left as strings to be resolved later
+    hints = get_type_hints_from_class_dict(
+        {
+            "__module__": "testapp.models",
+            "__annotations__": {"number": "int", "later": "LaterModel"},
+        }
+    )
+    assert hints == {"number": int, "later": "LaterModel"}
+
+
+@pytest.fixture
+def empty_registry(monkeypatch: pytest.MonkeyPatch):
+    # keep relationships registered by a test out of the shared registry
+    monkeypatch.setattr(ForeignRegistry, "_registry", {})
+    monkeypatch.setattr(ForeignRegistry, "_by_modelB", {})
+    monkeypatch.setattr(ForeignRegistry, "_unresolved", {})
+
+
+def test_reverse_relationship_resolved(empty_registry: None):
+    # a relationship is unresolved until the reverse is registered
+    forward = ForeignRegistry("ManyToOne", "RegistryA", "RegistryB", "b", "a_set")
+    assert ForeignRegistry.check_model_valid("RegistryB") == [forward]
+    assert forward in ForeignRegistry.all_relationships_resolved()
+
+    ForeignRegistry("OneToMany", "RegistryB", "RegistryA", "a_set", "b")
+    assert ForeignRegistry.check_model_valid("RegistryB") == []
+    assert ForeignRegistry.check_model_valid("RegistryA") == []
+    assert forward not in ForeignRegistry.all_relationships_resolved()